@@ -1,11 +1,102 @@
 import os
 import json
-import random
+import math
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import numpy as np
 from PIL import Image, ImageSequence
 
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:
+    # Numba is optional; without it layers are blended with plain NumPy
+    njit = None
+
+# Palette index reserved for transparent pixels in generated GIFs
+GIF_TRANSPARENT_INDEX = 255
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _blend_over(base, top, out):
+        """
+        Alpha-composite one RGBA layer over another in a single fused pass
+        
+        Parameters:
+        - base: uint8 RGBA array of the bottom image
+        - top: uint8 RGBA array of the layer to put on top, same size as base
+        - out: uint8 RGBA array for the result; may be the same array as base
+        """
+        height, width, _ = base.shape
+        for y in prange(height):
+            for x in range(width):
+                top_alpha = top[y, x, 3] / 255.0
+                if top_alpha == 1.0:
+                    for c in range(4):
+                        out[y, x, c] = top[y, x, c]
+                    continue
+                
+                base_alpha = base[y, x, 3] / 255.0 * (1.0 - top_alpha)
+                out_alpha = top_alpha + base_alpha
+                if out_alpha == 0.0:
+                    for c in range(4):
+                        out[y, x, c] = 0
+                    continue
+                
+                for c in range(3):
+                    value = (top[y, x, c] * top_alpha + base[y, x, c] * base_alpha) / out_alpha
+                    out[y, x, c] = np.uint8(value + 0.5)
+                out[y, x, 3] = np.uint8(out_alpha * 255.0 + 0.5)
+else:
+    _blend_over = None
+
+# Generator shared by the rendering worker processes
+_worker_generator = None
+
+def _init_worker(generator):
+    """
+    Store the generator in a rendering worker process
+    
+    Parameters:
+    - generator: CharacterGenerator whose configuration and caches to use
+    """
+    global _worker_generator
+    _worker_generator = generator
+    
+    # The pool already uses every core, so keep Numba to one thread each
+    if njit is not None:
+        set_num_threads(1)
+
+def _render_one(job):
+    """
+    Render one character in a worker process
+    
+    Parameters:
+    - job: Tuple of (selected_layers, layers_order, edition)
+    
+    Returns:
+    - Dictionary containing character metadata
+    """
+    selected_layers, layers_order, edition = job
+    return _worker_generator._create_character(selected_layers, layers_order, edition)
+
 class CharacterGenerator:
+    __slots__ = (
+        'config', 
+        'base_dir', 
+        'output_dir', 
+        'generated_dnas', 
+        '_images_dir', 
+        '_json_dir', 
+        '_layer_cache', 
+        '_np_cache', 
+        '_scratch', 
+        '_gif_cache', 
+        '_palette_cache', 
+        '_rng', 
+        '_render'
+    )
+    
     def __init__(self, config_path='config.json'):
         """
         Initialize the Character Generator with configuration
@@ -21,13 +112,178 @@ class CharacterGenerator:
         self.base_dir = self.config.get('base_layers_directory', 'nft_layers')
         self.output_dir = self.config.get('output_directory', 'output')
         
+        self._images_dir = os.path.join(self.output_dir, 'images')
+        self._json_dir = os.path.join(self.output_dir, 'json')
+        
         # Create output directories
         os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, 'images'), exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, 'json'), exist_ok=True)
+        os.makedirs(self._images_dir, exist_ok=True)
+        os.makedirs(self._json_dir, exist_ok=True)
+        
+        # Track generated DNAs as compact integer keys, grouped by the layer
+        # names they were drawn for
+        self.generated_dnas = {}
+        
+        # Cache of per-layer file listings, filled lazily on first access
+        self._layer_cache = {}
+        
+        # Cache of RGBA layer pixel arrays and reusable compositing buffers
+        self._np_cache = {}
+        self._scratch = {}
+        
+        # Cache of decoded background GIF frames keyed by file path, and of
+        # GIF palettes for backgrounds used without static layers
+        self._gif_cache = {}
+        self._palette_cache = {}
+        
+        # Random generator used for trait sampling; set a seed in the
+        # generation settings to make collections reproducible
+        seed = self.config.get('generation_settings', {}).get('seed')
+        self._rng = np.random.default_rng(seed)
+        
+        # Renderer fixed up front when every background has the same type
+        self._render = self._select_renderer()
+    
+    def _load_rgba(self, path):
+        """
+        Decode a layer image as RGBA; callers cache the pixel array, not the
+        image, so each layer is only held in memory once
+        
+        Parameters:
+        - path: Path to the image file
+        
+        Returns:
+        - RGBA image
+        """
+        image = Image.open(path)
+        if image.mode == "RGBA":
+            # Already RGBA; just decode it instead of copying via convert
+            image.load()
+            return image
+        return image.convert("RGBA")
+    
+    def _load_array(self, path, size=None):
+        """
+        Load a layer image as a cached uint8 RGBA pixel array
+        
+        Parameters:
+        - path: Path to the image file
+        - size: Optional (width, height) the layer has to match; layers of a
+          different size are scaled to it with nearest-neighbour resampling
+        
+        Returns:
+        - Read-only array of shape (height, width, 4)
+        """
+        key = (path, size)
+        array = self._np_cache.get(key)
+        if array is None:
+            image = self._load_rgba(path)
+            if size is not None and image.size != size:
+                print(f"Resizing layer {path} from {image.size} to {size}")
+                image = image.resize(size, Image.Resampling.NEAREST)
+            
+            array = np.asarray(image)
+            array.flags.writeable = False
+            self._np_cache[key] = array
+        return array
+    
+    def _load_gif(self, path):
+        """
+        Decode a background GIF once into cached RGBA frame arrays
+        
+        Parameters:
+        - path: Path to the GIF file
         
-        # Track generated DNAs
-        self.generated_dnas = set()
+        Returns:
+        - Tuple of (read-only RGBA frame arrays, per-frame durations in
+          milliseconds, loop count, whether any frame has transparent pixels)
+        """
+        cached = self._gif_cache.get(path)
+        if cached is None:
+            background_gif = Image.open(path)
+            frame_arrays = []
+            durations = []
+            for frame in ImageSequence.Iterator(background_gif):
+                durations.append(frame.info.get('duration', 100))
+                frame_array = np.asarray(frame if frame.mode == "RGBA" else frame.convert("RGBA"))
+                frame_array.flags.writeable = False
+                frame_arrays.append(frame_array)
+            
+            # Same alpha threshold _quantize_frame uses for transparent pixels
+            has_transparency = any(frame_array[..., 3].min() < 128 for frame_array in frame_arrays)
+            cached = (
+                frame_arrays, 
+                durations, 
+                background_gif.info.get('loop', 0), 
+                has_transparency
+            )
+            self._gif_cache[path] = cached
+        return cached
+    
+    def _scratch_buffers(self, shape):
+        """
+        Get float32 compositing buffers for an image shape, reusing them
+        between calls with the same shape
+        
+        Parameters:
+        - shape: Array shape (height, width, 4)
+        
+        Returns:
+        - Tuple of (accumulator, premultiplied layer, alpha) buffers
+        """
+        buffers = self._scratch.get(shape)
+        if buffers is None:
+            buffers = (
+                np.empty(shape, dtype=np.float32),
+                np.empty(shape, dtype=np.float32),
+                np.empty(shape[:2] + (1,), dtype=np.float32)
+            )
+            self._scratch[shape] = buffers
+        return buffers
+    
+    def _composite_np(self, base, layers):
+        """
+        Alpha-composite layers over a base image using Numba when it is
+        installed, otherwise NumPy
+        
+        Parameters:
+        - base: uint8 RGBA array of the bottom image
+        - layers: List of uint8 RGBA arrays, bottom to top, same size as base
+        
+        Returns:
+        - Composited RGBA image
+        """
+        if _blend_over is not None:
+            # Fused Numba kernel: one pass over the pixels per layer
+            out = base.copy()
+            for layer in layers:
+                _blend_over(out, layer, out)
+            return Image.fromarray(out, "RGBA")
+        
+        out, premultiplied, alpha = self._scratch_buffers(base.shape)
+        
+        # Work in premultiplied space (rgb * a, A) so "over" is the same
+        # multiply-add for all four channels: out = top + out * (1 - a_top)
+        np.multiply(base[..., 3:], 1 / 255, out=alpha)
+        np.multiply(base, alpha, out=out)
+        out[..., 3] = base[..., 3]
+        
+        multiply = np.multiply
+        subtract = np.subtract
+        add = np.add
+        for layer in layers:
+            multiply(layer[..., 3:], 1 / 255, out=alpha)
+            multiply(layer, alpha, out=premultiplied)
+            premultiplied[..., 3] = layer[..., 3]
+            subtract(1, alpha, out=alpha)
+            multiply(out, alpha, out=out)
+            add(out, premultiplied, out=out)
+        
+        # Back to straight alpha; fully transparent pixels stay zero
+        np.multiply(out[..., 3:], 1 / 255, out=alpha)
+        np.divide(out[..., :3], alpha, out=out[..., :3], where=alpha > 0)
+        np.rint(out, out=out)
+        return Image.fromarray(out.astype(np.uint8), "RGBA")
     
     def _generate_dna_hash(self, layers):
         """
@@ -69,43 +325,152 @@ class CharacterGenerator:
         # If no rarity specified, default to 100
         return name_without_ext, 100
     
-    def _select_layer_file(self, layer_name):
+    def _load_layer_files(self, layer_name):
         """
-        Randomly select a file from a layer directory with rarity support
+        Scan a layer directory once and cache its files with rarity weights
         
         Parameters:
         - layer_name: Name of the layer
         
         Returns:
-        - Dictionary with file path, type, filename, base name, and rarity
+        - Tuple of (layer file dictionaries, cumulative rarity array), or
+          None if the layer has no usable files
         """
-        layer_dir = os.path.join(self.base_dir, layer_name)
-        if not os.path.exists(layer_dir):
-            return None
+        if layer_name in self._layer_cache:
+            return self._layer_cache[layer_name]
         
-        layer_files = [f for f in os.listdir(layer_dir) if f.lower().endswith(('.png', '.gif'))]
+        layer_dir = os.path.join(self.base_dir, layer_name)
+        layer_files = []
+        if os.path.isdir(layer_dir):
+            # scandir gives the joined path and cached file type per entry;
+            # sorting keeps seeded runs reproducible across file systems
+            with os.scandir(layer_dir) as entries:
+                layer_files = sorted(
+                    (entry.name, entry.path) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(('.png', '.gif'))
+                )
         
         if not layer_files:
+            self._layer_cache[layer_name] = None
             return None
         
-        # Create a weighted selection based on rarity
-        weighted_files = []
-        for filename in layer_files:
+        # Build file info once, with cumulative rarity for weighted selection
+        files = []
+        for filename, path in layer_files:
             base_name, rarity = self._parse_rarity_filename(filename)
-            weighted_files.extend([filename] * rarity)
-        
-        selected_file = random.choice(weighted_files)
-        file_path = os.path.join(layer_dir, selected_file)
-        file_type = os.path.splitext(selected_file)[1].lower()[1:]
-        base_name, rarity = self._parse_rarity_filename(selected_file)
-        
-        return {
-            'path': file_path,
-            'type': file_type,
-            'filename': selected_file,
-            'base_name': base_name,
-            'rarity': rarity
-        }
+            layer_file = {
+                'path': path,
+                'type': filename.rsplit('.', 1)[1].lower(),
+                'filename': filename,
+                'base_name': base_name,
+                'rarity': rarity
+            }
+            files.append(layer_file)
+        
+        cumulative_rarity = np.cumsum([max(f['rarity'], 0) for f in files], dtype=np.float64)
+        
+        self._layer_cache[layer_name] = (files, cumulative_rarity)
+        return self._layer_cache[layer_name]
+    
+    def _select_renderer(self):
+        """
+        Pick the image renderer once if all backgrounds share a file type
+        
+        Returns:
+        - Tuple of (render method, image type), or None when backgrounds
+          are mixed and each character has to be dispatched separately
+        """
+        cached = self._load_layer_files('Background')
+        if cached is None:
+            return None
+        
+        background_types = {layer_file['type'] for layer_file in cached[0]}
+        if background_types == {'gif'}:
+            return self._generate_gif_character, 'gif'
+        if background_types == {'png'}:
+            return self._generate_png_character, 'png'
+        return None
+    
+    def _prepare_layers(self, layers_order):
+        """
+        Resolve the cached file lists for every layer that has files
+        
+        Parameters:
+        - layers_order: List of layer names to include
+        
+        Returns:
+        - List of (layer_name, layer files, cumulative rarity array) tuples
+        """
+        layers = []
+        for layer in layers_order:
+            cached = self._load_layer_files(layer)
+            if cached and cached[1][-1] > 0:
+                layers.append((layer, cached[0], cached[1]))
+        return layers
+    
+    def _sample_layer_indices(self, layers, count):
+        """
+        Draw rarity-weighted file indices for many characters at once
+        
+        Parameters:
+        - layers: Prepared layers from _prepare_layers
+        - count: Number of characters to draw
+        
+        Returns:
+        - Integer array of shape (count, len(layers)) with file indices
+        """
+        draws = self._rng.random((count, len(layers)))
+        indices = np.empty((count, len(layers)), dtype=np.intp)
+        for column, (_, _, cumulative_rarity) in enumerate(layers):
+            indices[:, column] = np.searchsorted(
+                cumulative_rarity,
+                draws[:, column] * cumulative_rarity[-1],
+                side='right'
+            )
+        return indices
+    
+    def _claim_unique_selections(self, layers, indices, limit):
+        """
+        Build selected layers for sampled rows whose DNA is still unused
+        
+        Parameters:
+        - layers: Prepared layers from _prepare_layers
+        - indices: Sampled file index array from _sample_layer_indices
+        - limit: Maximum number of selections to claim
+        
+        Returns:
+        - List of selected layer dictionaries, in sampling order
+        """
+        # DNA is kept as the file indices packed into one mixed-radix
+        # integer; the SHA-1 string is only computed for the metadata of
+        # characters actually generated
+        layer_names = tuple(layer for layer, _, _ in layers)
+        file_counts = [len(files) for _, files, _ in layers]
+        rows = indices.tolist()
+        if math.prod(file_counts) <= np.iinfo(np.int64).max:
+            strides = np.cumprod([1] + file_counts, dtype=np.int64)[:-1]
+            keys = (indices @ strides).tolist()
+        else:
+            # Too many combinations for an int64 key; fall back to tuples
+            keys = [tuple(row) for row in rows]
+        
+        generated_dnas = self.generated_dnas.setdefault(layer_names, set())
+        add_dna = generated_dnas.add
+        selections = []
+        add_selection = selections.append
+        for dna, row in zip(keys, rows):
+            if len(selections) >= limit:
+                break
+            
+            if dna in generated_dnas:
+                continue
+            
+            add_dna(dna)
+            add_selection({
+                layer: files[index]
+                for (layer, files, _), index in zip(layers, row)
+            })
+        return selections
     
     def generate_character(self, layers_order, edition, max_attempts=500):
         """
@@ -119,60 +484,74 @@ class CharacterGenerator:
         Returns:
         - Dictionary containing character metadata
         """
-        for attempt in range(max_attempts):
-            # Select layers
-            selected_layers = {}
-            for layer in layers_order:
-                layer_file = self._select_layer_file(layer)
-                if layer_file:
-                    selected_layers[layer] = layer_file
-            
-            # Generate DNA
-            dna = self._generate_dna_hash(selected_layers)
-            
-            # Check for uniqueness
-            if dna not in self.generated_dnas:
-                self.generated_dnas.add(dna)
-                
-                # Determine output type based on background
-                background = selected_layers.get('Background')
-                image_path = (
-                    self._generate_gif_character(selected_layers, edition) 
-                    if background and background['type'] == 'gif' 
-                    else self._generate_png_character(selected_layers, edition)
-                )
-                
-                # Prepare metadata with base_name for attributes
-                metadata = {
-                    "name": f"{self.config['collection_name']} #{edition}",
-                    "description": self.config['collection_description'],
-                    "image": f"{self.config['ipfs_base_uri']}{edition}.{image_path.split('.')[-1]}",
-                    "dna": dna,
-                    "edition": edition,
-                    "date": int(datetime.now().timestamp() * 1000),
-                    "attributes": [
-                        {
-                            "trait_type": layer,
-                            "value": selected_layers[layer]['base_name']
-                        }
-                        for layer in layers_order if layer in selected_layers
-                    ],
-                    "compiler": self.config['compiler']
-                }
-                
-                # Save metadata JSON
-                metadata_path = os.path.join(
-                    self.output_dir, 
-                    'json', 
-                    f"{edition}.json"
-                )
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2)
-                
-                return metadata
+        layers = self._prepare_layers(layers_order)
+        indices = self._sample_layer_indices(layers, max_attempts)
+        
+        for selected_layers in self._claim_unique_selections(layers, indices, 1):
+            metadata = self._create_character(selected_layers, layers_order, edition)
+            self._save_metadata([metadata])
+            return metadata
         
         raise ValueError(f"Could not generate a unique character after {max_attempts} attempts")
     
+    def _create_character(self, selected_layers, layers_order, edition):
+        """
+        Render a character image and build its metadata
+        
+        Parameters:
+        - selected_layers: Dictionary of selected layer files
+        - layers_order: List of layer names to include
+        - edition: Character edition number
+        
+        Returns:
+        - Dictionary containing character metadata
+        """
+        # Determine output type based on background
+        if self._render:
+            render, image_type = self._render
+        else:
+            background = selected_layers.get('Background')
+            if background and background['type'] == 'gif':
+                render, image_type = self._generate_gif_character, 'gif'
+            else:
+                render, image_type = self._generate_png_character, 'png'
+        render(selected_layers, edition)
+        
+        # Prepare metadata with base_name for attributes
+        config = self.config
+        metadata = {
+            "name": f"{config['collection_name']} #{edition}",
+            "description": config['collection_description'],
+            "image": f"{config['ipfs_base_uri']}{edition}.{image_type}",
+            "dna": self._generate_dna_hash(selected_layers),
+            "edition": edition,
+            "date": int(datetime.now().timestamp() * 1000),
+            "attributes": [
+                {
+                    "trait_type": layer,
+                    "value": selected_layers[layer]['base_name']
+                }
+                for layer in layers_order if layer in selected_layers
+            ],
+            "compiler": config['compiler']
+        }
+        
+        return metadata
+    
+    def _save_metadata(self, characters_metadata):
+        """
+        Write metadata JSON files for generated characters in one pass
+        
+        Parameters:
+        - characters_metadata: List of character metadata dictionaries
+        """
+        encode = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+        join = os.path.join
+        json_dir = self._json_dir
+        for metadata in characters_metadata:
+            with open(join(json_dir, f"{metadata['edition']}.json"), 'w', encoding='utf-8') as f:
+                f.write(encode(metadata))
+    
     def _generate_png_character(self, selected_layers, edition):
         """
         Generate a PNG character
@@ -186,35 +565,92 @@ class CharacterGenerator:
         """
         # Load background (PNG)
         background = selected_layers.get('Background')
-        background_image = Image.open(background['path']).convert("RGBA")
-        
-        # Create a new image with the same size and mode as background
-        combined_image = Image.new("RGBA", background_image.size, (0, 0, 0, 0))
+        background_array = self._load_array(background['path'])
+        size = (background_array.shape[1], background_array.shape[0])
         
-        # Paste background first
-        combined_image.paste(background_image, (0, 0))
-        
-        # Paste other static layers
-        for layer_name, layer_info in selected_layers.items():
-            if layer_name == 'Background' or layer_info['type'] == 'gif':
-                continue
-            
-            layer_image = Image.open(layer_info['path']).convert("RGBA")
-            combined_image.paste(layer_image, (0, 0), layer_image)
+        # Composite other static layers over the background
+        layer_arrays = [
+            self._load_array(layer_info['path'], size)
+            for layer_name, layer_info in selected_layers.items()
+            if layer_name != 'Background' and layer_info['type'] != 'gif'
+        ]
+        combined_image = self._composite_np(background_array, layer_arrays)
         
         # Generate output path
-        output_path = os.path.join(
-            self.output_dir, 
-            'images', 
-            f"{edition}.png"
-        )
+        output_path = os.path.join(self._images_dir, f"{edition}.png")
         
-        # Save the combined image
-        combined_image.save(output_path)
+        # Save the combined image; fast zlib settings by default since PNG
+        # encoding dominates the time spent per character
+        combined_image.save(
+            output_path, 
+            format='PNG', 
+            compress_level=self.config['generation_settings'].get('png_compress_level', 1), 
+            optimize=False
+        )
         
         print(f"Generated character PNG: {output_path}")
         return output_path
     
+    def _build_gif_palette(self, first_frame, frame_samples):
+        """
+        Build one adaptive palette shared by all frames of a GIF
+        
+        Parameters:
+        - first_frame: First composited RGBA frame at full resolution
+        - frame_samples: Downsampled RGBA arrays of the remaining frames
+        
+        Returns:
+        - Palette image with GIF_TRANSPARENT_INDEX left free for transparency
+        """
+        # Static layers appear on every frame, so the full first frame keeps
+        # their colors; the remaining frames only add the background's
+        # animation colors and are sampled at a lower resolution
+        samples = [np.asarray(first_frame)[..., :3]]
+        samples.extend(sample[..., :3] for sample in frame_samples)
+        
+        pixels = np.concatenate([sample.reshape(-1, 3) for sample in samples])
+        montage = Image.fromarray(pixels.reshape(-1, 1, 3), "RGB")
+        
+        palette_image = montage.quantize(
+            colors=GIF_TRANSPARENT_INDEX, 
+            method=Image.Quantize.FASTOCTREE
+        )
+        
+        # Some Pillow versions pad the palette to 256 entries with black, so
+        # the reserved index could win as the nearest color for dark opaque
+        # pixels. Fill every entry from GIF_TRANSPARENT_INDEX on with a copy
+        # of entry 0; ties go to the lower index, so quantizing against this
+        # palette never produces the transparent index
+        palette = palette_image.getpalette()[:3 * GIF_TRANSPARENT_INDEX]
+        palette_image.putpalette(palette + palette[:3] * (256 - len(palette) // 3))
+        return palette_image
+    
+    def _quantize_frame(self, frame, palette_image):
+        """
+        Quantize an RGBA frame to a shared palette for GIF encoding
+        
+        Parameters:
+        - frame: RGBA frame
+        - palette_image: Palette image from _build_gif_palette
+        
+        Returns:
+        - Palette mode frame; transparent pixels use GIF_TRANSPARENT_INDEX
+        """
+        dither = (
+            Image.Dither.FLOYDSTEINBERG 
+            if self.config['generation_settings'].get('gif_dither', False) 
+            else Image.Dither.NONE
+        )
+        quantized = frame.convert("RGB").quantize(palette=palette_image, dither=dither)
+        
+        alpha = frame.getchannel("A")
+        if alpha.getextrema()[0] < 128:
+            transparent_mask = alpha.point(lambda a: 255 if a < 128 else 0)
+            quantized.paste(GIF_TRANSPARENT_INDEX, (0, 0) + frame.size, transparent_mask)
+            quantized.info['transparency'] = GIF_TRANSPARENT_INDEX
+        
+        return quantized
+    
     def _generate_gif_character(self, selected_layers, edition):
         """
         Generate a GIF character
@@ -226,52 +662,70 @@ class CharacterGenerator:
         Returns:
         - Path to generated GIF
         """
-        # Load background GIF
+        # Load background GIF frames
         background = selected_layers.get('Background')
-        background_gif = Image.open(background['path'])
+        frame_arrays, durations, loop, has_transparency = self._load_gif(background['path'])
+        size = (frame_arrays[0].shape[1], frame_arrays[0].shape[0])
         
         # Prepare static layers
-        static_layers = {}
-        for layer_name, layer_info in selected_layers.items():
-            if layer_name == 'Background' or layer_info['type'] == 'gif':
-                continue
-            
-            layer_image = Image.open(layer_info['path']).convert("RGBA")
-            static_layers[layer_name] = layer_image
-        
-        # Prepare frames
-        frames = []
-        for frame in ImageSequence.Iterator(background_gif):
-            # Convert background frame to RGBA
-            frame = frame.convert("RGBA")
-            
-            # Create a new image with the same size and mode as background frame
-            combined_frame = Image.new("RGBA", frame.size, (0, 0, 0, 0))
-            
-            # Paste background frame first
-            combined_frame.paste(frame, (0, 0))
-            
-            # Paste static layers
-            for layer_image in static_layers.values():
-                combined_frame.paste(layer_image, (0, 0), layer_image)
-            
-            frames.append(combined_frame)
+        layer_arrays = [
+            self._load_array(layer_info['path'], size)
+            for layer_name, layer_info in selected_layers.items()
+            if layer_name != 'Background' and layer_info['type'] != 'gif'
+        ]
+        
+        # Static layers are the same on every frame, so flatten them into a
+        # single overlay once and composite only that onto each frame
+        if len(layer_arrays) > 1:
+            transparent = np.zeros_like(frame_arrays[0])
+            overlay = np.asarray(self._composite_np(transparent, layer_arrays))
+            layer_arrays = [overlay]
+        
+        first_frame = self._composite_np(frame_arrays[0], layer_arrays)
+        
+        # Quantize all frames to one shared palette so the encoder does not
+        # build a new palette for every frame. The remaining frames are only
+        # sampled at half resolution in each direction for the palette;
+        # without static layers the palette only depends on the background
+        # and is reused
+        palette_image = None if layer_arrays else self._palette_cache.get(background['path'])
+        if palette_image is None:
+            sampled_layers = [layer[::2, ::2] for layer in layer_arrays]
+            frame_samples = [
+                np.asarray(self._composite_np(frame_array[::2, ::2], sampled_layers))
+                for frame_array in frame_arrays[1:]
+            ]
+            palette_image = self._build_gif_palette(first_frame, frame_samples)
+            if not layer_arrays:
+                self._palette_cache[background['path']] = palette_image
+        
+        # Composite and quantize the remaining frames lazily while the GIF
+        # is written, so only a couple of full frames are held at once
+        composite = self._composite_np
+        quantize = self._quantize_frame
+        remaining_frames = (
+            quantize(composite(frame_array, layer_arrays), palette_image)
+            for frame_array in frame_arrays[1:]
+        )
         
         # Generate output path
-        output_path = os.path.join(
-            self.output_dir, 
-            'images', 
-            f"{edition}.gif"
-        )
+        output_path = os.path.join(self._images_dir, f"{edition}.gif")
+        
+        # Restore to the background before each frame when the background
+        # has transparent areas, so a previous frame does not show through
+        # them; opaque GIFs keep the default so Pillow can write smaller
+        # delta frames
+        disposal_options = {'disposal': 2} if has_transparency else {}
         
         # Save the combined GIF
-        frames[0].save(
+        self._quantize_frame(first_frame, palette_image).save(
             output_path, 
             save_all=True, 
-            append_images=frames[1:], 
+            append_images=remaining_frames, 
             optimize=False, 
-            duration=background_gif.info.get('duration', 100),  
-            loop=0
+            duration=durations, 
+            loop=loop, 
+            **disposal_options
         )
         
         print(f"Generated character GIF: {output_path}")
@@ -288,20 +742,78 @@ class CharacterGenerator:
         total_characters = self.config['generation_settings']['total_characters']
         max_attempts = self.config['generation_settings']['max_generation_attempts']
         
-        generated_characters = []
+        layers = self._prepare_layers(layers_order)
         
-        for edition in range(1, total_characters + 1):
-            try:
-                character_metadata = self.generate_character(
-                    layers_order, 
-                    edition, 
-                    max_attempts
-                )
-                generated_characters.append(character_metadata)
-                print(f"Generated character #{edition}")
-            except ValueError as e:
-                print(f"Error generating character #{edition}: {e}")
+        # Resolve unique layer selections for all editions up front; every
+        # round gives each still-missing edition one more attempt
+        selections = []
+        for attempt in range(max_attempts):
+            remaining = total_characters - len(selections)
+            if not remaining:
                 break
+            
+            indices = self._sample_layer_indices(layers, remaining)
+            selections.extend(self._claim_unique_selections(layers, indices, remaining))
+        
+        # Render all resolved editions, in parallel when more than one
+        # worker is configured
+        jobs = [
+            (selected_layers, layers_order, edition)
+            for edition, selected_layers in enumerate(selections, start=1)
+        ]
+        workers = self.config['generation_settings'].get('workers') or os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+        
+        generated_characters = []
+        
+        try:
+            if workers > 1:
+                # Decode the backgrounds and layers the jobs use before
+                # starting the pool so forked workers share the caches
+                # instead of each decoding them again
+                for selected_layers, _, _ in jobs:
+                    background = selected_layers.get('Background')
+                    if background is None:
+                        continue
+                    if background['type'] == 'gif':
+                        frame_array = self._load_gif(background['path'])[0][0]
+                    else:
+                        frame_array = self._load_array(background['path'])
+                    size = (frame_array.shape[1], frame_array.shape[0])
+                    for layer_name, layer_info in selected_layers.items():
+                        if layer_name != 'Background' and layer_info['type'] != 'gif':
+                            self._load_array(layer_info['path'], size)
+            
+                with ProcessPoolExecutor(
+                    max_workers=workers, 
+                    initializer=_init_worker, 
+                    initargs=(self,)
+                ) as executor:
+                    results = executor.map(_render_one, jobs, chunksize=8)
+                    for character_metadata in results:
+                        generated_characters.append(character_metadata)
+                        print(f"Generated character #{character_metadata['edition']}")
+            else:
+                for selected_layers, layers_order, edition in jobs:
+                    character_metadata = self._create_character(
+                        selected_layers, 
+                        layers_order, 
+                        edition
+                    )
+                    generated_characters.append(character_metadata)
+                    print(f"Generated character #{edition}")
+        finally:
+            # Write metadata for every edition rendered so far, even when a
+            # render failed, plus one combined file for the collection
+            self._save_metadata(generated_characters)
+            with open(os.path.join(self._json_dir, '_metadata.json'), 'w', encoding='utf-8') as f:
+                json.dump(generated_characters, f, indent=2, ensure_ascii=False)
+        
+        if len(selections) < total_characters:
+            print(
+                f"Error generating character #{len(selections) + 1}: "
+                f"Could not generate a unique character after {max_attempts} attempts"
+            )
         
         return generated_characters
 